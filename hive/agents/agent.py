@@ -37,6 +37,19 @@ class Agent(abc.ABC, Registrable):
         """
         pass
 
+    def act_batch(self, observations):
+        """Returns one action for each observation in the batch. Used by
+        vectorized runners that step several environments at once. The default
+        implementation simply calls :py:meth:`act` on each observation;
+        subclasses can override this to batch the forward pass.
+
+        Args:
+            observations: Batch of observations, one per environment.
+        Returns:
+            Sequence of actions, one per observation.
+        """
+        return [self.act(observation) for observation in observations]
+
     @abc.abstractmethod
     def update(self, update_info):
         """
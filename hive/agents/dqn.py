@@ -21,6 +21,7 @@ from hive.utils.schedule import (
     Schedule,
     SwitchSchedule,
 )
+from hive.utils.torch_utils import CUDAGraphModule
 from hive.utils.utils import LossFn, OptimizerFn, create_folder, seeder
 
 
@@ -53,6 +54,7 @@ class DQNAgent(Agent):
         min_replay_history: int = 5000,
         batch_size: int = 32,
         device="cpu",
+        use_cuda_graph: bool = False,
         logger: Logger = None,
         log_frequency: int = 100,
     ):
@@ -102,6 +104,13 @@ class DQNAgent(Agent):
             batch_size (int): The size of the batch sampled from the replay buffer
                 during learning.
             device: Device on which all computations should be run.
+            use_cuda_graph (bool): Whether to capture the Q-network's forward
+                pass for action selection with a CUDA graph and replay it each
+                step, eliminating per-call dispatch and kernel launch
+                overheads. Only takes effect when running on a CUDA device.
+                Should not be combined with networks whose forward pass is
+                stochastic (e.g. noisy layers), since the sampling would be
+                frozen into the graph.
             logger (ScheduledLogger): Logger used to log agent's metrics.
             log_frequency (int): How often to log the agent's metrics.
         """
@@ -115,6 +124,10 @@ class DQNAgent(Agent):
         self._init_fn = create_init_weights_fn(init_fn)
         self._device = torch.device("cpu" if not torch.cuda.is_available() else device)
         self.create_q_networks(representation_net)
+        if use_cuda_graph and self._device.type == "cuda":
+            self._act_qnet = CUDAGraphModule(self._qnet)
+        else:
+            self._act_qnet = self._qnet
         if optimizer_fn is None:
             optimizer_fn = torch.optim.Adam
         self._optimizer = optimizer_fn(self._qnet.parameters())
@@ -176,7 +189,11 @@ class DQNAgent(Agent):
             self._device
         )
         self._qnet.apply(self._init_fn)
-        self._target_qnet = copy.deepcopy(self._qnet).requires_grad_(False)
+        self._target_qnet = copy.deepcopy(self._qnet)
+        # detach_ instead of requires_grad_(False), since deepcopying a
+        # scripted network produces non-leaf parameters.
+        for param in self._target_qnet.parameters():
+            param.detach_()
 
     def train(self):
         """Changes the agent to training mode."""
@@ -198,14 +215,13 @@ class DQNAgent(Agent):
             update_info: Contains the information from the current timestep that the
                 agent should use to update itself.
         """
+        reward = update_info["reward"]
         if self._reward_clip is not None:
-            update_info["reward"] = np.clip(
-                update_info["reward"], -self._reward_clip, self._reward_clip
-            )
+            reward = np.clip(reward, -self._reward_clip, self._reward_clip)
         preprocessed_update_info = {
             "observation": update_info["observation"],
             "action": update_info["action"],
-            "reward": update_info["reward"],
+            "reward": reward,
             "done": update_info["done"],
         }
         if "agent_id" in update_info:
@@ -226,7 +242,9 @@ class DQNAgent(Agent):
                 - Preprocessed batch.
         """
         for key in batch:
-            batch[key] = torch.tensor(batch[key], device=self._device)
+            batch[key] = torch.as_tensor(batch[key]).to(
+                self._device, non_blocking=True
+            )
         return (batch["observation"],), (batch["next_observation"],), batch
 
     @torch.no_grad()
@@ -251,10 +269,15 @@ class DQNAgent(Agent):
 
         # Sample action. With epsilon probability choose random action,
         # otherwise select the action with the highest q-value.
-        observation = torch.tensor(
-            np.expand_dims(observation, axis=0), device=self._device
-        ).float()
-        qvals = self._qnet(observation)
+        # as_tensor wraps the observation without a host-side copy (even when
+        # it is a non-contiguous view, e.g. from PermuteImageWrapper); the
+        # float cast after the device transfer is the single copy made.
+        observation = (
+            torch.as_tensor(np.expand_dims(observation, axis=0))
+            .to(self._device, non_blocking=True)
+            .float()
+        )
+        qvals = self._act_qnet(observation)
         if self._rng.random() < epsilon:
             action = self._rng.integers(self._action_space.n)
         else:
@@ -270,6 +293,39 @@ class DQNAgent(Agent):
             self._state["episode_start"] = False
         return action
 
+    @torch.no_grad()
+    def act_batch(self, observations):
+        """Returns one action for each observation in the batch, using a single
+        forward pass through the Q-network. Follows the same epsilon greedy
+        policy as :py:meth:`act`, with the epsilon schedule updated once per
+        batch of observations.
+
+        Args:
+            observations: Batch of observations, one per environment.
+        """
+        if self._training:
+            if not self._learn_schedule.get_value():
+                epsilon = 1.0
+            else:
+                epsilon = self._epsilon_schedule.update()
+            if self._logger.update_step(self._timescale):
+                self._logger.log_scalar("epsilon", epsilon, self._timescale)
+        else:
+            epsilon = self._test_epsilon
+
+        observations = (
+            torch.as_tensor(np.stack(observations))
+            .to(self._device, non_blocking=True)
+            .float()
+        )
+        qvals = self._act_qnet(observations)
+        greedy_actions = torch.argmax(qvals, dim=1).cpu().numpy()
+        random_actions = self._rng.integers(
+            self._action_space.n, size=len(greedy_actions)
+        )
+        explore = self._rng.random(len(greedy_actions)) < epsilon
+        return np.where(explore, random_actions, greedy_actions)
+
     def update(self, update_info):
         """
         Updates the DQN agent.
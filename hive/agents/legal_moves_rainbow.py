@@ -27,7 +27,9 @@ class LegalMovesRainbowAgent(RainbowDQNAgent):
 
     def preprocess_update_batch(self, batch):
         for key in batch:
-            batch[key] = torch.tensor(batch[key], device=self._device)
+            batch[key] = torch.as_tensor(batch[key]).to(
+                self._device, non_blocking=True
+            )
         return (
             (batch["observation"], batch["action_mask"]),
             (batch["next_observation"], batch["next_action_mask"]),
@@ -48,9 +50,11 @@ class LegalMovesRainbowAgent(RainbowDQNAgent):
         else:
             epsilon = self._test_epsilon
 
-        vectorized_observation = torch.tensor(
-            np.expand_dims(observation["observation"], axis=0), device=self._device
-        ).float()
+        vectorized_observation = (
+            torch.as_tensor(np.expand_dims(observation["observation"], axis=0))
+            .to(self._device, non_blocking=True)
+            .float()
+        )
         legal_moves_as_int = [
             i for i, x in enumerate(observation["action_mask"]) if x == 1
         ]
@@ -1,3 +1,5 @@
+import torch
+
 from hive.utils.registry import registry
 from hive.agents.qnets.atari import NatureAtariDQNModel
 from hive.agents.qnets.base import FunctionApproximator
@@ -13,4 +15,34 @@ registry.register_all(
     },
 )
 
-get_qnet = getattr(registry, f"get_{FunctionApproximator.type_name()}")
+_get_qnet = getattr(registry, f"get_{FunctionApproximator.type_name()}")
+
+
+def get_qnet(object_or_config, prefix=None):
+    """Constructor for function approximators. Works exactly like the registry
+    constructors for other :py:class:`~hive.utils.registry.Registrable` types,
+    except that the config may contain an extra boolean kwarg :obj:`jit`. When
+    :obj:`jit` is true, the constructed network is compiled with
+    :py:func:`torch.jit.script`, which fuses elementwise operations in the
+    forward pass and avoids python dispatch overhead on every call. Set
+    :obj:`jit` to false (the default) to keep the network in eager mode, e.g.
+    for debugging.
+    """
+    jit = False
+    if isinstance(object_or_config, dict):
+        jit = object_or_config.get("kwargs", {}).pop("jit", False)
+    object_fn, config = _get_qnet(object_or_config, prefix=prefix)
+    if not jit or object_fn is None:
+        return object_fn, config
+    config.setdefault("kwargs", {})["jit"] = True
+
+    def scripted_fn(*args, **kwargs):
+        return torch.jit.script(object_fn(*args, **kwargs))
+
+    return scripted_fn, config
+
+
+# Route the registry's function approximator constructor through get_qnet so
+# that the jit kwarg is also handled when networks are built recursively from
+# agent configs.
+setattr(registry, f"get_{FunctionApproximator.type_name()}", get_qnet)
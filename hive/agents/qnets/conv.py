@@ -92,7 +92,7 @@ class ConvNetwork(nn.Module):
         else:
             self.mlp = torch.nn.Identity()
 
-    def forward(self, x):
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
         if len(x.shape) == 3:
             x = x.unsqueeze(0)
         elif len(x.shape) == 5:
@@ -42,13 +42,15 @@ class MLPNetwork(nn.Module):
             activation_fn = torch.nn.ReLU
 
         linear_fn = partial(NoisyLinear, std_init=std_init) if noisy else nn.Linear
-        modules = [linear_fn(np.prod(in_dim), hidden_units[0]), activation_fn()]
+        # int() keeps the layer sizes plain python ints, which
+        # :py:func:`torch.jit.script` requires.
+        modules = [linear_fn(int(np.prod(in_dim)), hidden_units[0]), activation_fn()]
         for i in range(len(hidden_units) - 1):
             modules.append(linear_fn(hidden_units[i], hidden_units[i + 1]))
             modules.append(activation_fn())
         self.network = torch.nn.Sequential(*modules)
 
-    def forward(self, x):
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
         x = x.float()
         x = torch.flatten(x, start_dim=1)
         return self.network(x)
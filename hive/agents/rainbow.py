@@ -217,7 +217,11 @@ class RainbowDQNAgent(DQNAgent):
             self._qnet = network
         self._qnet.to(device=self._device)
         self._qnet.apply(self._init_fn)
-        self._target_qnet = copy.deepcopy(self._qnet).requires_grad_(False)
+        self._target_qnet = copy.deepcopy(self._qnet)
+        # detach_ instead of requires_grad_(False), since deepcopying a
+        # scripted network produces non-leaf parameters.
+        for param in self._target_qnet.parameters():
+            param.detach_()
 
     @torch.no_grad()
     def act(self, observation):
@@ -234,9 +238,13 @@ class RainbowDQNAgent(DQNAgent):
         else:
             epsilon = self._test_epsilon
 
-        observation = torch.tensor(
-            np.expand_dims(observation, axis=0), device=self._device
-        ).float()
+        # Wrap without a host-side copy and cast after the device transfer;
+        # see DQNAgent.act.
+        observation = (
+            torch.as_tensor(np.expand_dims(observation, axis=0))
+            .to(self._device, non_blocking=True)
+            .float()
+        )
         qvals = self._qnet(observation)
 
         if self._rng.random() < epsilon:
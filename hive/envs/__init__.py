@@ -1,6 +1,7 @@
 from hive.envs.base import BaseEnv, ParallelEnv
 from hive.envs.env_spec import EnvSpec
 from hive.envs.gym_env import GymEnv
+from hive.envs.vec_env import SubprocVecEnv
 
 try:
     from hive.envs.minigrid import MiniGridEnv
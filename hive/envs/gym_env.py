@@ -1,3 +1,5 @@
+import itertools
+
 import gym
 
 from hive.envs.base import BaseEnv
@@ -22,7 +24,30 @@ class GymEnv(BaseEnv):
         self._seed = None
         self.create_env(env_name, **kwargs)
         super().__init__(self.create_env_spec(env_name, **kwargs), num_players)
-        
+        # The gym step API version is detected on the first step, after which
+        # the matching specialized implementation is bound directly.
+        self._step = self._detect_step_api
+        # Turn advancement specialized on num_players: elided entirely for
+        # single-player environments, otherwise a prebuilt cycle that always
+        # yields the next player's turn without modulo arithmetic.
+        if self._num_players == 1:
+            self._turn = 0
+            self._advance_turn = self._advance_turn_single
+        else:
+            self._turn_cycle = itertools.cycle(range(self._num_players))
+            next(self._turn_cycle)
+            self._advance_turn = self._advance_turn_cycle
+
+    def _advance_turn_single(self):
+        """Turn advancement for single-player environments: always 0."""
+        return 0
+
+    def _advance_turn_cycle(self):
+        """Turn advancement for multi-player environments, driven by the
+        prebuilt turn cycle."""
+        self._turn = next(self._turn_cycle)
+        return self._turn
+
     def set_seed(self, seed: int):
         """Call this right after creating the env (from your runner)."""
         self._seed = int(seed)
@@ -83,17 +108,49 @@ class GymEnv(BaseEnv):
             return obs, self._turn
 
     def step(self, action):
+        return self._step(action)
+
+    def _bind_step(self, step_impl):
+        """Binds the specialized step implementation. If no subclass overrides
+        :py:meth:`step`, it is also bound directly on the instance, so later
+        calls go straight to the specialized version without even the
+        delegating call.
+
+        Args:
+            step_impl (callable): Bound step implementation to use for all
+                subsequent steps.
+        """
+        self._step = step_impl
+        if type(self).step is GymEnv.step:
+            self.step = step_impl
+
+    def _detect_step_api(self, action):
+        """Runs the first environment step, then binds the step implementation
+        specialized for the detected gym step API version, so subsequent steps
+        skip the length check and its error branch entirely.
+        """
         step_result = self._env.step(action)
         if len(step_result) == 5:
+            self._bind_step(self._step_v26)
             observation, reward, terminated, truncated, info = step_result
-            done = terminated or truncated 
+            done = terminated or truncated
         elif len(step_result) == 4:
+            self._bind_step(self._step_v21)
             observation, reward, done, info = step_result
         else:
             raise ValueError(f"Unexpected step return length: {len(step_result)}")
-    
-        self._turn = (self._turn + 1) % self._num_players
-        return observation, reward, done, self._turn, info
+
+        return observation, reward, done, self._advance_turn(), info
+
+    def _step_v26(self, action):
+        """Step for the gym >=0.26 five-tuple step API."""
+        observation, reward, terminated, truncated, info = self._env.step(action)
+        return observation, reward, terminated or truncated, self._advance_turn(), info
+
+    def _step_v21(self, action):
+        """Step for the gym <=0.25 four-tuple step API."""
+        observation, reward, done, info = self._env.step(action)
+        return observation, reward, done, self._advance_turn(), info
 
     def render(self, mode="rgb_array"):
         return self._env.render(mode=mode)
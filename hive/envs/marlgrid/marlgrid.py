@@ -1,5 +1,5 @@
 from hive.envs import GymEnv, ParallelEnv
-from hive.envs.wrappers.gym_wrappers import FlattenWrapper, PermuteImageWrapper
+from hive.envs.wrappers.gym_wrappers import permute_image_wrapper
 from marlgrid import envs
 
 
@@ -24,9 +24,7 @@ class MarlGridEnv(ParallelEnv, GymEnv):
         else:
             super().create_env(env_name, **kwargs)
 
-        self._env = PermuteImageWrapper(self._env)
-        if flatten:
-            self._env = FlattenWrapper(self._env)
+        self._env = permute_image_wrapper(self._env, flatten=flatten)
 
     def create_env_spec(self, name, **kwargs):
         return super().create_env_spec(
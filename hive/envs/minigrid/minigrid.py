@@ -8,7 +8,7 @@ from gym_minigrid.wrappers import (
 )
 
 from hive.envs.gym_env import GymEnv
-from hive.envs.wrappers.gym_wrappers import FlattenWrapper, PermuteImageWrapper
+from hive.envs.wrappers.gym_wrappers import permute_image_wrapper
 
 
 class MiniGridEnv(GymEnv):
@@ -47,9 +47,9 @@ class MiniGridEnv(GymEnv):
             self._env = RGBImgPartialObsWrapper(self._env)
 
         if not use_mission:
-            self._env = PermuteImageWrapper(ImgObsWrapper(self._env))
-            if flattened_obs:
-                self._env = FlattenWrapper(self._env)
+            self._env = permute_image_wrapper(
+                ImgObsWrapper(self._env), flatten=flattened_obs
+            )
         elif flattened_obs:
             # Encode the mission into observation vector
             self._env = FlatObsWrapper(self._env)
@@ -0,0 +1,316 @@
+import multiprocessing as mp
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+def _subproc_worker(pipe, parent_pipe, env_fn):
+    """Target function run by each :py:class:`SubprocVecEnv` worker process.
+
+    Creates the environment in the worker process, and services step/reset
+    requests sent over the pipe. When an environment reports that its episode
+    is done, it is automatically reset, and the first observation of the new
+    episode is returned along with the done flag for the finished episode.
+
+    Once the master has set up the shared result buffers, step results are
+    written directly into the worker's row of those buffers, and only the
+    info dict travels over the pipe.
+
+    Args:
+        pipe (multiprocessing.Connection): Worker's end of the pipe.
+        parent_pipe (multiprocessing.Connection): Master's end of the pipe,
+            closed in the worker.
+        env_fn (callable): Function with no arguments that creates the
+            environment.
+    """
+    parent_pipe.close()
+    env = env_fn()
+    shms = []
+    result_bufs = None
+    try:
+        while True:
+            command, data = pipe.recv()
+            if command == "step":
+                observation, reward, done, turn, info = env.step(data)
+                if done:
+                    observation, turn = env.reset()
+                if result_bufs is None:
+                    pipe.send((observation, reward, done, turn, info))
+                else:
+                    idx, obs_buf, reward_buf, done_buf, turn_buf = result_bufs
+                    np.copyto(obs_buf[idx], observation)
+                    reward_buf[idx] = reward
+                    done_buf[idx] = done
+                    turn_buf[idx] = 0 if turn is None else turn
+                    pipe.send(info)
+            elif command == "reset":
+                pipe.send(env.reset())
+            elif command == "seed":
+                pipe.send(env.seed(data))
+            elif command == "attach_shm":
+                idx, names, num_envs, obs_shape, obs_dtype = data
+                shms = [shared_memory.SharedMemory(name=name) for name in names]
+                for shm in shms:
+                    # The worker only attaches to the master's segments;
+                    # unregister them here so this process's resource tracker
+                    # does not try to unlink them a second time on exit.
+                    resource_tracker.unregister(shm._name, "shared_memory")
+                result_bufs = (
+                    idx,
+                    np.ndarray(
+                        (num_envs,) + obs_shape, dtype=obs_dtype, buffer=shms[0].buf
+                    ),
+                    np.ndarray(num_envs, dtype=np.float32, buffer=shms[1].buf),
+                    np.ndarray(num_envs, dtype=bool, buffer=shms[2].buf),
+                    np.ndarray(num_envs, dtype=np.int64, buffer=shms[3].buf),
+                )
+                pipe.send(True)
+            elif command == "close":
+                env.close()
+                result_bufs = None
+                for shm in shms:
+                    shm.close()
+                pipe.close()
+                break
+    except (KeyboardInterrupt, EOFError):
+        pass
+
+
+class SubprocVecEnv:
+    """Steps multiple copies of an environment in parallel worker processes.
+
+    Each worker process owns one environment created from the corresponding
+    entry of :obj:`env_fns`, and communicates with the master process over a
+    :py:class:`multiprocessing.Pipe`. The batched :py:meth:`step` sends one
+    action to every worker and gathers the results, so the Python overhead of
+    the individual ``env.step`` calls and any environment-side computation run
+    concurrently across CPUs.
+
+    For ndarray observations, step results are exchanged through
+    :py:class:`multiprocessing.shared_memory.SharedMemory` buffers sized
+    ``(num_envs,) + obs_shape``: each worker writes its row in place and only
+    the info dict is pickled over the pipe, avoiding a per-step serialization
+    and copy of every observation. The buffers are created by the master after
+    the first reset, once the observation shape is known. The observation
+    batch returned by :py:meth:`step_wait` is a view of the shared buffer and
+    is overwritten by the next step, so consumers that retain it must copy.
+
+    Environments are automatically reset by their workers when an episode
+    finishes. For the step on which an environment reports done, the
+    observation returned is the first observation of the next episode.
+    """
+
+    def __init__(self, env_fns):
+        """
+        Args:
+            env_fns (list[callable]): List of functions with no arguments, each
+                of which creates one environment. The number of workers is the
+                length of this list.
+        """
+        self._num_envs = len(env_fns)
+        self._closed = False
+        self._pipes = []
+        self._processes = []
+        self._shms = []
+        self._obs_buf = None
+        self._reward_buf = None
+        self._done_buf = None
+        self._turn_buf = None
+        for env_fn in env_fns:
+            parent_pipe, child_pipe = mp.Pipe()
+            process = mp.Process(
+                target=_subproc_worker,
+                args=(child_pipe, parent_pipe, env_fn),
+                daemon=True,
+            )
+            process.start()
+            child_pipe.close()
+            self._pipes.append(parent_pipe)
+            self._processes.append(process)
+
+    @property
+    def num_envs(self):
+        return self._num_envs
+
+    def _setup_shared_memory(self, observation):
+        """Create the shared result buffers based on the first observation
+        seen, and have every worker attach to them. Called once; structured
+        (non-ndarray) observations leave the pipe-based transport in place.
+
+        Args:
+            observation: First observation returned by one of the
+                environments.
+        """
+        if not isinstance(observation, np.ndarray):
+            return
+        sizes = [
+            observation.nbytes * self._num_envs,
+            np.dtype(np.float32).itemsize * self._num_envs,
+            np.dtype(bool).itemsize * self._num_envs,
+            np.dtype(np.int64).itemsize * self._num_envs,
+        ]
+        self._shms = [
+            shared_memory.SharedMemory(create=True, size=size) for size in sizes
+        ]
+        self._obs_buf = np.ndarray(
+            (self._num_envs,) + observation.shape,
+            dtype=observation.dtype,
+            buffer=self._shms[0].buf,
+        )
+        self._reward_buf = np.ndarray(
+            self._num_envs, dtype=np.float32, buffer=self._shms[1].buf
+        )
+        self._done_buf = np.ndarray(
+            self._num_envs, dtype=bool, buffer=self._shms[2].buf
+        )
+        self._turn_buf = np.ndarray(
+            self._num_envs, dtype=np.int64, buffer=self._shms[3].buf
+        )
+        names = [shm.name for shm in self._shms]
+        for idx, pipe in enumerate(self._pipes):
+            pipe.send(
+                (
+                    "attach_shm",
+                    (
+                        idx,
+                        names,
+                        self._num_envs,
+                        observation.shape,
+                        observation.dtype,
+                    ),
+                )
+            )
+        for pipe in self._pipes:
+            pipe.recv()
+
+    def reset(self):
+        """Resets all the environments.
+
+        Returns:
+            observations (np.ndarray): Batch of initial observations, with the
+                environment dimension first.
+            turns (np.ndarray): The agent indices which should take turn in
+                each environment.
+        """
+        for pipe in self._pipes:
+            pipe.send(("reset", None))
+        observations, turns = zip(*[pipe.recv() for pipe in self._pipes])
+        if self._obs_buf is None:
+            self._setup_shared_memory(observations[0])
+        return np.stack(observations), np.asarray(turns)
+
+    def step_async(self, actions, indices=None):
+        """Sends one action to each worker without waiting for the results.
+        The workers step their environments concurrently with whatever the
+        master process does until the matching :py:meth:`step_wait` call.
+
+        Args:
+            actions: Sequence of actions, one per environment being stepped.
+            indices: Indices of the environments to step. If None, all
+                environments are stepped.
+        """
+        if indices is None:
+            indices = range(self._num_envs)
+        for idx, action in zip(indices, actions):
+            self._pipes[idx].send(("step", action))
+
+    def step_wait(self, indices=None):
+        """Gathers the results of a previous :py:meth:`step_async` call.
+
+        Args:
+            indices: Indices of the environments to gather results from. Must
+                match the indices passed to :py:meth:`step_async`.
+
+        Returns:
+            observations (np.ndarray): Batch of next observations. When the
+                shared buffers are in use and all environments are gathered,
+                this is a view that the next step overwrites.
+            rewards (np.ndarray): Rewards achieved from each transition.
+            dones (np.ndarray): Whether each episode has ended.
+            turns (np.ndarray): The agent indices which should take turn in
+                each environment.
+            infos (list[dict]): Additional information from each environment.
+        """
+        full = indices is None
+        if full:
+            indices = range(self._num_envs)
+        if self._obs_buf is None:
+            observations, rewards, dones, turns, infos = zip(
+                *[self._pipes[idx].recv() for idx in indices]
+            )
+            return (
+                np.stack(observations),
+                np.asarray(rewards, dtype=np.float32),
+                np.asarray(dones, dtype=bool),
+                np.asarray(turns),
+                list(infos),
+            )
+        # The recv below is also the synchronization point: once a worker's
+        # info arrives, its row of the shared buffers is fully written.
+        infos = [self._pipes[idx].recv() for idx in indices]
+        if full:
+            return (
+                self._obs_buf,
+                self._reward_buf,
+                self._done_buf,
+                self._turn_buf,
+                infos,
+            )
+        indices = np.asarray(indices)
+        return (
+            self._obs_buf[indices],
+            self._reward_buf[indices],
+            self._done_buf[indices],
+            self._turn_buf[indices],
+            infos,
+        )
+
+    def step(self, actions):
+        """Runs one step of every environment using the batch of actions.
+
+        Args:
+            actions: Sequence of actions, one per environment.
+
+        Returns:
+            observations (np.ndarray): Batch of next observations.
+            rewards (np.ndarray): Rewards achieved from each transition.
+            dones (np.ndarray): Whether each episode has ended.
+            turns (np.ndarray): The agent indices which should take turn in
+                each environment.
+            infos (list[dict]): Additional information from each environment.
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def seed(self, seed=None):
+        """Reseeds all the environments. Each environment is given a distinct
+        seed offset from the one provided.
+
+        Args:
+            seed (int): Base seed to use for the environments.
+        """
+        for idx, pipe in enumerate(self._pipes):
+            pipe.send(("seed", None if seed is None else seed + idx))
+        return [pipe.recv() for pipe in self._pipes]
+
+    def close(self):
+        """Shuts down all the worker processes and releases the shared
+        buffers."""
+        if self._closed:
+            return
+        for pipe in self._pipes:
+            pipe.send(("close", None))
+        for process in self._processes:
+            process.join()
+        self._obs_buf = None
+        self._reward_buf = None
+        self._done_buf = None
+        self._turn_buf = None
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self._shms = []
+        self._closed = True
+
+    def __del__(self):
+        self.close()
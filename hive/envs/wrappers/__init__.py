@@ -1 +1,7 @@
-from hive.envs.wrappers.gym_wrappers import FlattenWrapper, PermuteImageWrapper
+from hive.envs.wrappers.gym_wrappers import (
+    FlattenAndPermuteWrapper,
+    FlattenWrapper,
+    PermuteImageWrapper,
+    WhitelistInfoWrapper,
+    permute_image_wrapper,
+)
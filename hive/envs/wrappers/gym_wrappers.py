@@ -1,33 +1,81 @@
-import operator
-from functools import reduce
-
 import gym
 import numpy as np
 
 
 class ExposeSymbolicState(gym.Wrapper):
+    def __init__(self, env, batch_buf=None, env_id=0):
+        """
+        Args:
+            env (gym.Env): Environment to wrap.
+            batch_buf (np.ndarray): Optional ``(num_envs, 3)`` int16 array to
+                write the symbolic state into, e.g. shared memory for
+                vectorized runs. The wrapper writes only its own row, and the
+                master process can read the whole batch at once per step.
+            env_id (int): Row of :obj:`batch_buf` owned by this environment.
+        """
+        super().__init__(env)
+        # Single fixed-width buffer reused on every step, so exposing the
+        # symbolic state allocates nothing in the step loop. Consumers that
+        # keep the symbolic state beyond the current step must copy it.
+        if batch_buf is None:
+            self._sym = np.empty(3, dtype=np.int16)
+        else:
+            self._sym = batch_buf[env_id]
+        self._sym_info = {"symbolic_state": self._sym}
+
     def _snap(self):
         e = self.env.unwrapped
         # tailor to your MiniGridLoCA:
-        x, y = int(e.agent_pos[0]), int(e.agent_pos[1])
-        d = int(e.agent_dir)  # 0..3
-        # pack into a small fixed-width vector (fast & pickle-friendly)
-        sym = np.array([x, y, d], dtype=np.int16)
-        return {"symbolic_state": sym}
+        self._sym[0] = e.agent_pos[0]
+        self._sym[1] = e.agent_pos[1]
+        self._sym[2] = e.agent_dir  # 0..3
+        return self._sym_info
 
     def reset(self, **kwargs):
         obs, info = self.env.reset(**kwargs)
-        info = dict(info or {})
+        # gym 0.26 guarantees info is a dict, so update it in place instead of
+        # re-wrapping it every call.
         info.update(self._snap())
         return obs, info
 
     def step(self, action):
         obs, r, term, trunc, info = self.env.step(action)
-        info = dict(info or {})
         info.update(self._snap())
         return obs, r, term, trunc, info
 
 
+class WhitelistInfoWrapper(gym.Wrapper):
+    """Keeps only a fixed set of keys from the env's info dicts.
+
+    Environments often put debug or telemetry data (sometimes whole frames)
+    into info, which then travels through the transition path and into
+    anything that retains transitions. Filtering against a fixed schema at
+    the wrapper boundary keeps the per-step work and the retained memory
+    proportional to the keys that are actually consumed.
+    """
+
+    def __init__(self, env, keys=("symbolic_state",)):
+        """
+        Args:
+            env (gym.Env): Environment to wrap.
+            keys (tuple[str]): The info keys to keep; everything else is
+                dropped.
+        """
+        super().__init__(env)
+        self._keys = tuple(keys)
+
+    def _filter(self, info):
+        return {key: info[key] for key in self._keys if key in info}
+
+    def reset(self, **kwargs):
+        obs, info = self.env.reset(**kwargs)
+        return obs, self._filter(info)
+
+    def step(self, action):
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        return obs, reward, terminated, truncated, self._filter(info)
+
+
 class FlattenWrapper(gym.core.ObservationWrapper):
     """
     Flatten the observation to one dimensional vector.
@@ -36,33 +84,40 @@ class FlattenWrapper(gym.core.ObservationWrapper):
     def __init__(self, env):
         super().__init__(env)
 
+        # ravel() avoids the copy flatten() makes for the metadata arrays, and
+        # np.prod computes the flattened size in a C loop.
         if isinstance(env.observation_space, gym.spaces.Tuple):
             self.observation_space = gym.spaces.Tuple(
                 tuple(
                     gym.spaces.Box(
-                        low=space.low.flatten(),
-                        high=space.high.flatten(),
-                        shape=(reduce(operator.mul, space.shape, 1),),
+                        low=space.low.ravel(),
+                        high=space.high.ravel(),
+                        shape=(int(np.prod(space.shape)),),
                         dtype=space.dtype,
                     )
                     for space in env.observation_space
                 )
             )
-            self._is_tuple = True
+            # Bind the right variant once, so the common single-space case
+            # does not pay for the tuple branch on every step.
+            self.observation = self._observation_tuple
         else:
             self.observation_space = gym.spaces.Box(
-                low=env.observation_space.low.flatten(),
-                high=env.observation_space.high.flatten(),
-                shape=(reduce(operator.mul, env.observation_space.shape, 1),),
+                low=env.observation_space.low.ravel(),
+                high=env.observation_space.high.ravel(),
+                shape=(int(np.prod(env.observation_space.shape)),),
                 dtype=env.observation_space.dtype,
             )
-            self._is_tuple = False
+            self.observation = self._observation_single
 
-    def observation(self, obs):
-        if self._is_tuple:
-            return tuple(o.flatten() for o in obs)
-        else:
-            return obs.flatten()
+    # flatten() always copies; reshape(-1) on a C-contiguous array (the usual
+    # case for gym observations) returns a view, so the copy only happens for
+    # non-contiguous inputs.
+    def _observation_single(self, obs):
+        return np.ascontiguousarray(obs).reshape(-1)
+
+    def _observation_tuple(self, obs):
+        return tuple(np.ascontiguousarray(o).reshape(-1) for o in obs)
 
 
 class PermuteImageWrapper(gym.core.ObservationWrapper):
@@ -75,27 +130,91 @@ class PermuteImageWrapper(gym.core.ObservationWrapper):
             self.observation_space = gym.spaces.Tuple(
                 tuple(
                     gym.spaces.Box(
-                        low=np.transpose(space.low, [2, 1, 0]),
-                        high=np.transpose(space.high, [2, 1, 0]),
+                        low=space.low.transpose(2, 0, 1),
+                        high=space.high.transpose(2, 0, 1),
                         shape=(space.shape[-1],) + space.shape[:-1],
                         dtype=space.dtype,
                     )
                     for space in env.observation_space
                 )
             )
-            self._is_tuple = True
+            self.observation = self._observation_tuple
         else:
             self.observation_space = gym.spaces.Box(
-                low=np.transpose(env.observation_space.low, [2, 1, 0]),
-                high=np.transpose(env.observation_space.high, [2, 1, 0]),
+                low=env.observation_space.low.transpose(2, 0, 1),
+                high=env.observation_space.high.transpose(2, 0, 1),
                 shape=(env.observation_space.shape[-1],)
                 + env.observation_space.shape[:-1],
                 dtype=env.observation_space.dtype,
             )
-            self._is_tuple = False
+            self.observation = self._observation_single
+
+    # transpose returns a strides-only view; the copy happens only when a
+    # consumer needs a contiguous array (e.g. when the frame is written into a
+    # stacking or replay buffer).
+    _perm = (2, 0, 1)
+
+    def _observation_single(self, obs):
+        return obs.transpose(self._perm)
+
+    def _observation_tuple(self, obs):
+        return tuple(o.transpose(self._perm) for o in obs)
+
+
+class FlattenAndPermuteWrapper(gym.core.ObservationWrapper):
+    """Changes the image format from HWC to CHW and flattens the result to a
+    one dimensional vector, equivalent to
+    ``FlattenWrapper(PermuteImageWrapper(env))`` in a single wrapper.
 
-    def observation(self, obs):
-        if self._is_tuple:
-            return tuple(np.transpose(o, [2, 1, 0]) for o in obs)
+    Fusing the two avoids a second traversal of the observation: the
+    transpose is a strides-only view and the reshape makes the single copy.
+    """
+
+    _perm = (2, 0, 1)
+
+    def __init__(self, env):
+        super().__init__(env)
+
+        if isinstance(env.observation_space, gym.spaces.Tuple):
+            self.observation_space = gym.spaces.Tuple(
+                tuple(
+                    gym.spaces.Box(
+                        low=space.low.transpose(self._perm).reshape(-1),
+                        high=space.high.transpose(self._perm).reshape(-1),
+                        shape=(int(np.prod(space.shape)),),
+                        dtype=space.dtype,
+                    )
+                    for space in env.observation_space
+                )
+            )
+            self.observation = self._observation_tuple
         else:
-            return np.transpose(obs, [2, 1, 0])
+            space = env.observation_space
+            self.observation_space = gym.spaces.Box(
+                low=space.low.transpose(self._perm).reshape(-1),
+                high=space.high.transpose(self._perm).reshape(-1),
+                shape=(int(np.prod(space.shape)),),
+                dtype=space.dtype,
+            )
+            self.observation = self._observation_single
+
+    def _observation_single(self, obs):
+        return obs.transpose(self._perm).reshape(-1)
+
+    def _observation_tuple(self, obs):
+        return tuple(o.transpose(self._perm).reshape(-1) for o in obs)
+
+
+def permute_image_wrapper(env, flatten=False):
+    """Applies the HWC to CHW image format conversion to an environment,
+    fused with flattening into a single-pass wrapper when :obj:`flatten` is
+    true.
+
+    Args:
+        env (gym.Env): Environment with image observations to wrap.
+        flatten (bool): Whether the observations should also be flattened to
+            one dimensional vectors.
+    """
+    if flatten:
+        return FlattenAndPermuteWrapper(env)
+    return PermuteImageWrapper(env)
@@ -365,13 +365,21 @@ class SimpleReplayBuffer(BaseReplayBuffer):
             reward: The reward from taking action at current observation
             done: If current observation was the last observation in the episode
         """
+        # Snapshot the observation once on arrival (the caller may reuse the
+        # array it passed in). The same snapshot then backs both this
+        # transition's observation and the previous transition's
+        # next_observation: stored frames are never mutated, so sharing the
+        # reference halves the copies and memory for observation data.
+        observation = np.array(observation, dtype=self._dtype["observation"])
         if self._previous_transition is not None:
-            self._previous_transition["next_observation"] = observation
+            transition = self._previous_transition
             self._write_index = (self._write_index + 1) % self._capacity
             self._n = int(min(self._capacity, self._n + 1))
-            for key in self._data:
-                self._data[key][self._write_index] = np.asarray(
-                    self._previous_transition[key], dtype=self._dtype[key]
+            self._data["observation"][self._write_index] = transition["observation"]
+            self._data["next_observation"][self._write_index] = observation
+            for key in ("action", "reward", "done"):
+                self._data[key][self._write_index] = np.array(
+                    transition[key], dtype=self._dtype[key]
                 )
         self._previous_transition = {
             "observation": observation,
@@ -171,7 +171,9 @@ def set_up_experiment(config):
         }
     )
     config.update(args)
-    full_config = utils.Chomp(copy.deepcopy(config))
+    # A shallow copy is enough here: every key that differs between config and
+    # full_config is replaced wholesale below, never mutated in place.
+    full_config = utils.Chomp(copy.copy(config))
 
     if "seed" in config:
         utils.seeder.set_global_seed(config["seed"])
@@ -1,10 +1,13 @@
 import argparse
 import copy
 
+import numpy as np
+
 from hive import agents as agent_lib
 from hive import envs
+from hive.envs.vec_env import SubprocVecEnv
 from hive.runners.base import Runner
-from hive.runners.utils import TransitionInfo, load_config
+from hive.runners.utils import Transition, TransitionInfo, load_config
 from hive.utils import experiment, loggers, schedule, utils
 from hive.utils.registry import get_parsed_args
 
@@ -24,6 +27,8 @@ class SingleAgentRunner(Runner):
         stack_size,
         max_steps_per_episode=27000,
         learning_buffer="lofo",
+        num_envs=1,
+        environment_fn=None,
     ):
         """Initializes the Runner object.
 
@@ -43,6 +48,14 @@ class SingleAgentRunner(Runner):
             max_steps_per_episode (int): The maximum number of steps to run an episode
                 for.
             learning_buffer (str): Learning buffer type ("fifo", "lofo").
+            num_envs (int): Number of environments to step in parallel. If this
+                is greater than 1, episodes are collected from :obj:`num_envs`
+                copies of the environment running in subprocesses, and action
+                selection is batched across environments.
+            environment_fn (callable): Function with no arguments that creates
+                an environment. Must be provided if :obj:`num_envs` is greater
+                than 1, and is used to create the environment copies in the
+                worker processes.
         """
         super().__init__(
             environment,
@@ -53,9 +66,22 @@ class SingleAgentRunner(Runner):
             test_frequency,
             test_episodes,
             max_steps_per_episode,
-            learning_buffer,
         )
-        self._transition_info = TransitionInfo(self._agents, stack_size)
+        self._num_envs = num_envs
+        if num_envs > 1:
+            if environment_fn is None:
+                raise ValueError(
+                    "environment_fn must be provided when num_envs > 1"
+                )
+            self._vec_environment = SubprocVecEnv(
+                [environment_fn for _ in range(num_envs)]
+            )
+            self._transition_info = [
+                TransitionInfo(self._agents, stack_size) for _ in range(num_envs)
+            ]
+        else:
+            self._vec_environment = None
+            self._transition_info = TransitionInfo(self._agents, stack_size)
 
         self._learning_buffer = learning_buffer
         if self._learning_buffer not in ["fifo", "lofo"]:
@@ -78,36 +104,32 @@ class SingleAgentRunner(Runner):
         next_observation, reward, done, _, other_info = self._environment.step(action)
 
         if self._learning_buffer == "fifo":
-            info = {
-                "observation": observation,
-                "reward": reward,
-                "action": action,
-                "done": done,
-                "info": other_info,
-            }
-            if self._training:
-                agent.update(copy.deepcopy(info))
+            update_observation = observation
         else:
-            info = {
-                "observation": stacked_observation,
-                "reward": reward,
-                "action": action,
-                "done": done,
-                "info": other_info,
-            }
-            if self._training:
-                agent.update(copy.deepcopy(info))
-            info["observation"] = observation
-
-        self._transition_info.record_info(agent, info)
-        episode_metrics[agent.id]["reward"] += info["reward"]
+            update_observation = stacked_observation
+        transition = Transition(
+            observation=update_observation,
+            action=action,
+            reward=reward,
+            done=done,
+            info=other_info,
+        )
+        if self._training:
+            agent.update(transition)
+
+        self._transition_info.record_observation(agent, observation)
+        episode_metrics[agent.id]["reward"] += reward
         episode_metrics[agent.id]["episode_length"] += 1
         episode_metrics["full_episode_length"] += 1
 
         return done, next_observation
 
     def run_episode(self):
-        """Run a single episode of the environment."""
+        """Run a single episode of the environment. If the runner was created
+        with :obj:`num_envs` greater than 1, runs one episode in each of the
+        parallel environments instead, with batched action selection."""
+        if self._num_envs > 1:
+            return self.run_vectorized_episode()
         episode_metrics = self.create_episode_metrics()
         done = False
         observation, _ = self._environment.reset()
@@ -121,6 +143,83 @@ class SingleAgentRunner(Runner):
 
         return episode_metrics
 
+    def run_vectorized_episode(self):
+        """Run one episode in each of the parallel environments.
+
+        The environments are split into two groups that are stepped
+        alternately: while one group's workers are stepping their
+        environments, the master process selects actions and runs agent
+        updates for the other group, hiding environment latency behind the
+        agent's computation. Environments that finish their episode are
+        automatically reset by their workers and stop contributing to the
+        metrics; the loop ends once every environment has finished an episode
+        or the step limit is reached.
+        """
+        episode_metrics = self.create_episode_metrics()
+        agent = self._agents[0]
+        observations, _ = self._vec_environment.reset()
+        for transition_info in self._transition_info:
+            transition_info.reset()
+            transition_info.start_agent(agent)
+        running = np.ones(self._num_envs, dtype=bool)
+        groups = np.array_split(
+            np.arange(self._num_envs), min(2, self._num_envs)
+        )
+        steps = 0
+        while running.any() and steps < self._max_steps_per_episode:
+            # Select actions and launch the asynchronous step for each group
+            # in turn, so the first group's environments are already stepping
+            # while the second group's actions are computed.
+            group_steps = []
+            for group in groups:
+                stacked_observations = [
+                    self._transition_info[idx].get_stacked_state(
+                        agent, observations[idx]
+                    )
+                    for idx in group
+                ]
+                actions = agent.act_batch(stacked_observations)
+                self._vec_environment.step_async(actions, group)
+                group_steps.append((stacked_observations, actions))
+            # Gather each group's results and do the per-transition work; the
+            # first group's updates overlap the second group's stepping.
+            for group, (stacked_observations, actions) in zip(
+                groups, group_steps
+            ):
+                next_observations, rewards, dones, _, other_infos = (
+                    self._vec_environment.step_wait(group)
+                )
+                for pos, idx in enumerate(group):
+                    if not running[idx]:
+                        observations[idx] = next_observations[pos]
+                        continue
+                    super().run_one_step(observations[idx], 0, episode_metrics)
+                    if self._learning_buffer == "fifo":
+                        update_observation = observations[idx]
+                    else:
+                        update_observation = stacked_observations[pos]
+                    transition = Transition(
+                        observation=update_observation,
+                        action=actions[pos],
+                        reward=rewards[pos],
+                        done=dones[pos],
+                        info=other_infos[pos],
+                    )
+                    if self._training:
+                        agent.update(transition)
+                    self._transition_info[idx].record_observation(
+                        agent, observations[idx]
+                    )
+                    episode_metrics[agent.id]["reward"] += rewards[pos]
+                    episode_metrics[agent.id]["episode_length"] += 1
+                    episode_metrics["full_episode_length"] += 1
+                    if dones[pos]:
+                        running[idx] = False
+                    observations[idx] = next_observations[pos]
+            steps += 1
+
+        return episode_metrics
+
 
 def set_up_experiment(config):
     """Returns a :py:class:`SingleAgentRunner` object based on the config and any
@@ -138,24 +237,28 @@ def set_up_experiment(config):
             "test_episodes": int,
             "max_steps_per_episode": int,
             "stack_size": int,
+            "num_envs": int,
             "resume": bool,
             "run_name": str,
             "save_dir": str,
         }
     )
     config.update(args)
-    full_config = utils.Chomp(copy.deepcopy(config))
+    # A shallow copy is enough here: every key that differs between config and
+    # full_config is replaced wholesale below, never mutated in place.
+    full_config = utils.Chomp(copy.copy(config))
 
     if "seed" in config:
         utils.seeder.set_global_seed(config["seed"])
 
+    env_lib, agents_lib = envs, agent_lib
     if config.get("learning_buffer") == "lofo":
-        from loca3 import envs
-        from loca3 import agents as agent_lib
-        from loca3 import replays
-        from loca3.agents import qnets
+        from loca3 import envs as env_lib
+        from loca3 import agents as agents_lib
+        from loca3 import replays  # noqa: F401
+        from loca3.agents import qnets  # noqa: F401
 
-    environment_fn, full_config["environment"] = envs.get_env(
+    environment_fn, full_config["environment"] = env_lib.get_env(
         config["environment"], "environment"
     )
     environment = environment_fn()
@@ -174,7 +277,7 @@ def set_up_experiment(config):
     logger_fn, full_config["loggers"] = loggers.get_logger(logger_config, "loggers")
     logger = logger_fn()
 
-    agent_fn, full_config["agent"] = agent_lib.get_agent(config["agent"], "agent")
+    agent_fn, full_config["agent"] = agents_lib.get_agent(config["agent"], "agent")
     agent = agent_fn(
         observation_space=env_spec.observation_space[0],
         action_space=env_spec.action_space[0],
@@ -205,7 +308,9 @@ def set_up_experiment(config):
         config.get("test_episodes", 1),
         config.get("stack_size", 1),
         config.get("max_steps_per_episode", 1e9),
-        config.get("learning_buffer"),
+        config.get("learning_buffer", "lofo"),
+        num_envs=config.get("num_envs", 1),
+        environment_fn=environment_fn,
     )
     if config.get("resume", False):
         runner.resume()
@@ -1,5 +1,5 @@
 import os
-from collections import deque
+from collections import deque, namedtuple
 import sys
 
 import numpy as np
@@ -9,6 +9,33 @@ import yaml
 from hive.utils.utils import PACKAGE_ROOT
 
 
+class Transition(
+    namedtuple("Transition", ["observation", "action", "reward", "done", "info"])
+):
+    """An immutable transition that runners pass to
+    :py:meth:`~hive.agents.agent.Agent.update`.
+
+    Constructing a :py:class:`Transition` does not copy any of its fields, so
+    it replaces the per-step deepcopy previously done by the runners. Anything
+    that needs to retain a field beyond the current step (such as a replay
+    buffer) is responsible for copying it into its own storage.
+
+    In addition to regular namedtuple access, fields can be accessed
+    dictionary-style by name, so agents can handle both transitions and the
+    dictionary update infos used by the multi-agent loop interchangeably.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+
 def load_config(
     config=None,
     preset_config=None,
@@ -134,6 +161,16 @@ class TransitionInfo:
         self._agent_ids = [agent.id for agent in agents]
         self._num_agents = len(agents)
         self._stack_size = stack_size
+        # Pre-allocated contiguous sliding windows of observations, keyed by
+        # agent id. The first stack_size - 1 frames are the previous
+        # observations, oldest first, and the last slot holds the current
+        # observation; recording a new observation shifts the window by one
+        # frame. Allocated lazily once the observation shape is known, and
+        # reused across episodes and steps so that stacking does not allocate
+        # in the step loop. Only used for ndarray observations; structured
+        # observations fall back to the deque path.
+        self._stack_bufs = {}
+        self._stacked_views = {}
         self.reset()
 
     def reset(self):
@@ -143,6 +180,8 @@ class TransitionInfo:
         self._previous_observations = {
             agent_id: deque(maxlen=self._stack_size - 1) for agent_id in self._agent_ids
         }
+        for stack_buf in self._stack_bufs.values():
+            stack_buf.fill(0)
 
     def is_started(self, agent):
         """Check if agent has started its episode.
@@ -169,7 +208,54 @@ class TransitionInfo:
         """
         self._transitions[agent.id].update(info)
         if "observation" in info:
-            self._previous_observations[agent.id].append(info["observation"])
+            self._record_observation(agent.id, info["observation"])
+
+    def record_observation(self, agent, observation):
+        """Record the agent's current observation, to be used for stacking.
+        Equivalent to passing ``{"observation": observation}`` to
+        :py:meth:`record_info`, without allocating the wrapper dict.
+
+        Args:
+            agent (Agent): Agent to record observation for.
+            observation: Observation to record.
+        """
+        self._transitions[agent.id]["observation"] = observation
+        self._record_observation(agent.id, observation)
+
+    def _record_observation(self, agent_id, observation):
+        """Record a previous observation for the agent, to be used for
+        stacking. ndarray observations are written into the agent's circular
+        buffer; other observation types are kept in a deque.
+
+        Args:
+            agent_id (str): Id of agent to record observation for.
+            observation: Observation to record.
+        """
+        if self._stack_size == 1:
+            return
+        if isinstance(observation, np.ndarray):
+            if agent_id not in self._stack_bufs:
+                self._create_stack_buffer(agent_id, observation)
+            stack_buf = self._stack_bufs[agent_id]
+            # Slide the window by one frame and write the new observation into
+            # the newest previous-observation slot.
+            stack_buf[: self._stack_size - 2] = stack_buf[1 : self._stack_size - 1]
+            np.copyto(stack_buf[self._stack_size - 2], observation)
+        else:
+            self._previous_observations[agent_id].append(observation)
+
+    def _create_stack_buffer(self, agent_id, observation):
+        """Allocate the sliding window buffer for the agent, based on the
+        shape and dtype of the first observation seen. The stacked state
+        returned to callers is a flat view of this buffer, so for CHW image
+        frames it has shape (stack_size * channels, height, width)."""
+        stack_buf = np.zeros(
+            (self._stack_size,) + observation.shape, dtype=observation.dtype
+        )
+        self._stack_bufs[agent_id] = stack_buf
+        self._stacked_views[agent_id] = stack_buf.reshape(
+            (-1,) + observation.shape[1:]
+        )
 
     def update_reward(self, agent, reward):
         """Add a reward to the agent.
@@ -219,6 +305,10 @@ class TransitionInfo:
         by this agent are stacked with the current observation. If not enough
         observations have been recorded, zero arrays are appended.
 
+        For ndarray observations, the stacked state is gathered into a
+        pre-allocated buffer that is reused on every call, so consumers that
+        retain it beyond the current step must copy it.
+
         Args:
             agent (Agent): Agent to get stacked state for.
             observation: Current observation.
@@ -226,6 +316,11 @@ class TransitionInfo:
 
         if self._stack_size == 1:
             return observation
+        if isinstance(observation, np.ndarray):
+            if agent.id not in self._stack_bufs:
+                self._create_stack_buffer(agent.id, observation)
+            np.copyto(self._stack_bufs[agent.id][-1], observation)
+            return self._stacked_views[agent.id]
         while len(self._previous_observations[agent.id]) < self._stack_size - 1:
             self._previous_observations[agent.id].append(zeros_like(observation))
 
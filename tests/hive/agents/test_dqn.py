@@ -258,6 +258,32 @@ def test_create_agent_with_configs(env_spec):
     assert action < 2
 
 
+def test_create_agent_with_jit_config(env_spec):
+    agent_config = {
+        "name": "DQNAgent",
+        "kwargs": {
+            "observation_space": env_spec.observation_space,
+            "action_space": env_spec.action_space,
+            "representation_net": {
+                "name": "MLPNetwork",
+                "kwargs": {"hidden_units": 5, "jit": True},
+            },
+            "replay_buffer": {
+                "name": "SimpleReplayBuffer",
+                "kwargs": {"capacity": 10},
+            },
+            "min_replay_history": 2,
+            "device": "cpu",
+        },
+    }
+    agent, full_config = get_agent(agent_config)
+    agent = agent()
+    assert isinstance(agent._qnet.base_network, torch.jit.ScriptModule)
+    assert full_config["kwargs"]["representation_net"]["kwargs"]["jit"]
+    action = agent.act(np.zeros(2))
+    assert action < 2
+
+
 def test_train_step(agent_with_mock_optimizer):
     agent_with_mock_optimizer.train()
     for idx in range(8):
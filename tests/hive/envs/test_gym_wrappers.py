@@ -0,0 +1,119 @@
+import gym
+import numpy as np
+import pytest
+
+from hive.envs.wrappers.gym_wrappers import (
+    FlattenAndPermuteWrapper,
+    FlattenWrapper,
+    PermuteImageWrapper,
+    WhitelistInfoWrapper,
+    permute_image_wrapper,
+)
+
+
+class FakeImageEnv(gym.Env):
+    """A fake environment with a deterministic HWC image observation."""
+
+    def __init__(self, height=4, width=6, channels=3):
+        self.observation_space = gym.spaces.Box(
+            low=0, high=255, shape=(height, width, channels), dtype=np.uint8
+        )
+        self.action_space = gym.spaces.Discrete(2)
+        self._observation = np.arange(
+            height * width * channels, dtype=np.uint8
+        ).reshape(height, width, channels)
+
+    def reset(self, seed=None, options=None):
+        return self._observation, {}
+
+    def step(self, action):
+        return self._observation, 0.0, False, False, {}
+
+
+@pytest.fixture
+def env():
+    return FakeImageEnv()
+
+
+def test_flatten_wrapper(env):
+    wrapped_env = FlattenWrapper(env)
+    assert wrapped_env.observation_space.shape == (4 * 6 * 3,)
+    observation, _ = wrapped_env.reset()
+    assert observation.shape == (4 * 6 * 3,)
+    assert np.array_equal(observation, env._observation.flatten())
+
+
+def test_permute_wrapper(env):
+    wrapped_env = PermuteImageWrapper(env)
+    assert wrapped_env.observation_space.shape == (3, 4, 6)
+    observation, _ = wrapped_env.reset()
+    assert observation.shape == (3, 4, 6)
+    assert np.array_equal(observation, env._observation.transpose(2, 0, 1))
+    # The permuted observation should be a view of the original data, not a
+    # copy.
+    assert np.shares_memory(observation, env._observation)
+
+
+def test_flatten_and_permute_composition(env):
+    wrapped_env = FlattenWrapper(PermuteImageWrapper(env))
+    assert wrapped_env.observation_space.shape == (3 * 4 * 6,)
+    observation, _ = wrapped_env.reset()
+    assert observation.shape == (3 * 4 * 6,)
+    assert np.array_equal(
+        observation, env._observation.transpose(2, 0, 1).flatten()
+    )
+
+
+def test_fused_flatten_and_permute_wrapper(env):
+    fused_env = FlattenAndPermuteWrapper(env)
+    composed_env = FlattenWrapper(PermuteImageWrapper(FakeImageEnv()))
+    assert (
+        fused_env.observation_space.shape == composed_env.observation_space.shape
+    )
+    assert np.array_equal(
+        fused_env.observation_space.low, composed_env.observation_space.low
+    )
+    fused_observation, _ = fused_env.reset()
+    composed_observation, _ = composed_env.reset()
+    assert np.array_equal(fused_observation, composed_observation)
+
+
+def test_permute_image_wrapper_factory(env):
+    assert isinstance(permute_image_wrapper(env), PermuteImageWrapper)
+    assert isinstance(
+        permute_image_wrapper(env, flatten=True), FlattenAndPermuteWrapper
+    )
+
+
+def test_whitelist_info_wrapper():
+    class InfoEnv(FakeImageEnv):
+        def reset(self, seed=None, options=None):
+            observation, _ = super().reset(seed=seed, options=options)
+            return observation, {"debug_frame": np.zeros(10)}
+
+        def step(self, action):
+            observation, reward, terminated, truncated, _ = super().step(action)
+            info = {"symbolic_state": 1, "debug_frame": np.zeros(10)}
+            return observation, reward, terminated, truncated, info
+
+    wrapped_env = WhitelistInfoWrapper(InfoEnv())
+    _, info = wrapped_env.reset()
+    assert info == {}
+    _, _, _, _, info = wrapped_env.step(0)
+    assert info == {"symbolic_state": 1}
+
+
+def test_expose_symbolic_state_batched():
+    class SymbolicEnv(FakeImageEnv):
+        agent_pos = (2, 3)
+        agent_dir = 1
+
+    from hive.envs.wrappers.gym_wrappers import ExposeSymbolicState
+
+    batch_buf = np.zeros((2, 3), dtype=np.int16)
+    wrapped_env = ExposeSymbolicState(SymbolicEnv(), batch_buf=batch_buf, env_id=1)
+    _, info = wrapped_env.reset()
+    # The wrapper writes its row of the batch buffer in place.
+    assert np.array_equal(batch_buf[1], [2, 3, 1])
+    assert np.shares_memory(info["symbolic_state"], batch_buf[1])
+    assert np.array_equal(batch_buf[0], [0, 0, 0])
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from hive.envs.gym_env import GymEnv
+from hive.envs.vec_env import SubprocVecEnv
+
+test_environments = ["CartPole-v0", "MountainCar-v0"]
+
+
+@pytest.mark.parametrize("env_name", test_environments)
+def test_reset_func(env_name):
+    num_envs = 2
+    vec_env = SubprocVecEnv([lambda: GymEnv(env_name)] * num_envs)
+    observations, turns = vec_env.reset()
+
+    single_env = GymEnv(env_name)
+    assert observations.shape == (num_envs,) + single_env.env_spec.observation_space[
+        0
+    ].shape
+    assert np.all(turns == 0)
+    vec_env.close()
+
+
+@pytest.mark.parametrize("env_name", test_environments)
+def test_step_func(env_name):
+    num_envs = 3
+    vec_env = SubprocVecEnv([lambda: GymEnv(env_name)] * num_envs)
+    vec_env.reset()
+    observations, rewards, dones, turns, infos = vec_env.step([0] * num_envs)
+
+    assert observations.shape[0] == num_envs
+    assert rewards.shape == (num_envs,)
+    assert rewards.dtype == np.float32
+    assert dones.shape == (num_envs,)
+    assert dones.dtype == bool
+    assert len(infos) == num_envs
+    for info in infos:
+        assert isinstance(info, dict)
+    vec_env.close()
+
+
+def test_step_async_groups():
+    num_envs = 4
+    vec_env = SubprocVecEnv([lambda: GymEnv("CartPole-v0")] * num_envs)
+    vec_env.reset()
+    # Stepping the two halves asynchronously should produce the same shaped
+    # results as a full batched step.
+    groups = np.array_split(np.arange(num_envs), 2)
+    for group in groups:
+        vec_env.step_async([0] * len(group), group)
+    for group in groups:
+        observations, rewards, dones, turns, infos = vec_env.step_wait(group)
+        assert observations.shape[0] == len(group)
+        assert rewards.shape == (len(group),)
+        assert dones.shape == (len(group),)
+        assert len(infos) == len(group)
+    vec_env.close()
+
+
+def test_auto_reset():
+    num_envs = 2
+    vec_env = SubprocVecEnv([lambda: GymEnv("CartPole-v0")] * num_envs)
+    observations, _ = vec_env.reset()
+    # CartPole episodes always terminate, so stepping long enough with a fixed
+    # action should produce at least one done in every environment, with the
+    # workers resetting and continuing automatically.
+    dones_seen = np.zeros(num_envs, dtype=bool)
+    for _ in range(500):
+        observations, _, dones, _, _ = vec_env.step([0] * num_envs)
+        dones_seen |= dones
+        if dones_seen.all():
+            break
+    assert dones_seen.all()
+    assert observations.shape[0] == num_envs
+    vec_env.close()
@@ -80,3 +80,32 @@ def test_loading_buffer(tmpdir, batch_size, initial_buffer):
     assert batch["reward"].shape == (batch_size,)
     assert batch["next_observation"].shape == (batch_size, 4)
     assert batch["done"].shape == (batch_size,)
+
+
+def test_observation_snapshot_shared():
+    """
+    test that observations are copied when added and shared across adjacent
+    transitions
+    """
+    buffer = replays.SimpleReplayBuffer(capacity=10)
+    observation = np.ones(4, dtype="float32")
+    buffer.add(observation=observation, action=0, reward=0.0, done=False)
+    # Mutating the caller's array after adding must not change what was
+    # stored.
+    observation[:] = -1.0
+    buffer.add(
+        observation=np.full(4, 2.0, dtype="float32"),
+        action=1,
+        reward=0.0,
+        done=False,
+    )
+    buffer.add(
+        observation=np.full(4, 3.0, dtype="float32"),
+        action=0,
+        reward=0.0,
+        done=False,
+    )
+    assert np.array_equal(buffer._data["observation"][0], np.ones(4))
+    # The same snapshot backs one transition's next_observation and the
+    # following transition's observation.
+    assert buffer._data["next_observation"][0] is buffer._data["observation"][1]
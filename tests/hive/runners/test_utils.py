@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from hive.agents.random import RandomAgent
+from hive.envs import EnvSpec
+from hive.runners.utils import TransitionInfo
+
+import gym
+
+
+@pytest.fixture
+def agent():
+    env_spec = EnvSpec(
+        "test_env", gym.spaces.Box(0, 1, (2,)), gym.spaces.Discrete(2)
+    )
+    return RandomAgent(env_spec.observation_space, env_spec.action_space)
+
+
+def test_stacked_state_padding(agent):
+    transition_info = TransitionInfo([agent], 4)
+    observation = np.array([1.0, 2.0])
+    stacked = transition_info.get_stacked_state(agent, observation)
+    expected = np.concatenate([np.zeros(6), observation])
+    assert np.array_equal(stacked, expected)
+
+
+def test_stacked_state_ordering(agent):
+    transition_info = TransitionInfo([agent], 3)
+    observations = [np.ones(2) * idx for idx in range(1, 5)]
+    for observation in observations[:-1]:
+        transition_info.get_stacked_state(agent, observation)
+        transition_info.record_info(agent, {"observation": observation})
+    stacked = transition_info.get_stacked_state(agent, observations[-1])
+    # The stacked state should be the previous observations followed by the
+    # current one, oldest first.
+    expected = np.concatenate(observations[-3:])
+    assert np.array_equal(stacked, expected)
+
+
+def test_stacked_state_reset(agent):
+    transition_info = TransitionInfo([agent], 3)
+    for idx in range(3):
+        observation = np.ones(2) * (idx + 1)
+        transition_info.get_stacked_state(agent, observation)
+        transition_info.record_info(agent, {"observation": observation})
+    transition_info.reset()
+    observation = np.array([5.0, 6.0])
+    stacked = transition_info.get_stacked_state(agent, observation)
+    expected = np.concatenate([np.zeros(4), observation])
+    assert np.array_equal(stacked, expected)
+
+
+def test_record_observation_matches_record_info(agent):
+    transition_info = TransitionInfo([agent], 3)
+    other_info = TransitionInfo([agent], 3)
+    for idx in range(1, 4):
+        observation = np.ones(2) * idx
+        transition_info.record_observation(agent, observation)
+        other_info.record_info(agent, {"observation": observation})
+    observation = np.array([9.0, 10.0])
+    assert np.array_equal(
+        transition_info.get_stacked_state(agent, observation),
+        other_info.get_stacked_state(agent, observation),
+    )
+
+
+def test_stacked_state_dict_observation(agent):
+    transition_info = TransitionInfo([agent], 2)
+    observation = {"observation": np.array([1.0, 2.0])}
+    stacked = transition_info.get_stacked_state(agent, observation)
+    assert np.array_equal(stacked["observation"], np.array([0.0, 0.0, 1.0, 2.0]))
+
+
+def test_stack_size_one_returns_observation(agent):
+    transition_info = TransitionInfo([agent], 1)
+    observation = np.array([1.0, 2.0])
+    stacked = transition_info.get_stacked_state(agent, observation)
+    assert stacked is observation